@@ -35,13 +35,13 @@ class RNNoiseFilter(BaseAudioFilter):
     processes it in chunks.
     """
 
-    def __init__(self, resampler_quality: str = "QQ") -> None:
+    def __init__(self, resampler_quality: str = "VHQ") -> None:
         """Initialize the RNNoise noise suppression filter.
 
         Args:
             resampler_quality: Quality of the resampler if resampling is needed.
-                               One of "VHQ", "HQ", "MQ", "LQ", "QQ". Defaults to "QQ"
-                               (Quick) for lowest latency.
+                               One of "VHQ", "HQ", "MQ", "LQ", "QQ". Defaults to "VHQ".
+                               Use "QQ" (Quick) for lowest latency and CPU usage.
         """
         self._filtering = True
         self._sample_rate = 0
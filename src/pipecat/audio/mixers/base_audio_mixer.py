@@ -67,6 +67,12 @@ class BaseAudioMixer(ABC):
         output transport and that should be mixed with the mixer audio if the
         mixer is enabled.
 
+        This is called from the output transport audio task for every audio
+        chunk (even when the bot is not speaking), so it should return
+        quickly. Mixers doing expensive processing should run it outside of
+        the event loop (e.g. with `asyncio.to_thread()`) so audio output is
+        not delayed.
+
         Args:
             audio: Raw audio bytes from the transport to mix.
 
@@ -75,6 +75,10 @@ class SoundfileMixer(BaseAudioMixer):
         self._mixing = mixing
         self._loop = loop
 
+        # Scratch buffer reused across `mix()` calls to avoid allocating
+        # intermediate arrays for every audio chunk.
+        self._mix_buffer = np.empty(0, dtype=np.float64)
+
     async def start(self, sample_rate: int):
         """Initialize the mixer and load all sound files.
 
@@ -190,6 +194,12 @@ class SoundfileMixer(BaseAudioMixer):
 
         sound_np = sound[start_pos:end_pos]
 
-        mixed_audio = np.clip(audio_np + sound_np * self._volume, -32768, 32767).astype(np.int16)
+        if len(self._mix_buffer) != chunk_size:
+            self._mix_buffer = np.empty(chunk_size, dtype=np.float64)
+
+        mixed_audio = self._mix_buffer
+        np.multiply(sound_np, self._volume, out=mixed_audio)
+        np.add(mixed_audio, audio_np, out=mixed_audio)
+        np.clip(mixed_audio, -32768, 32767, out=mixed_audio)
 
         return mixed_audio.astype(np.int16).tobytes()
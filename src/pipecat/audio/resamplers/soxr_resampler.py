@@ -25,17 +25,19 @@ class SOXRAudioResampler(BaseAudioResampler):
     """Audio resampler implementation using the SoX resampler library.
 
     This resampler uses the SoX resampler library configured for very high
-    quality (VHQ) resampling, providing excellent audio quality at the cost
-    of additional computational overhead.
+    quality (VHQ) resampling by default, providing excellent audio quality at
+    the cost of additional computational overhead.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, quality: str = "VHQ", **kwargs):
         """Initialize the SoX audio resampler.
 
         Args:
+            quality: SoX resampler quality ("QQ", "LQ", "MQ", "HQ" or "VHQ").
+                Defaults to "VHQ".
             **kwargs: Additional keyword arguments (currently unused).
         """
-        pass
+        self._quality = quality
 
     async def resample(self, audio: bytes, in_rate: int, out_rate: int) -> bytes:
         """Resample audio data using SoX resampler library.
@@ -51,6 +53,6 @@ class SOXRAudioResampler(BaseAudioResampler):
         if in_rate == out_rate:
             return audio
         audio_data = np.frombuffer(audio, dtype=np.int16)
-        resampled_audio = soxr.resample(audio_data, in_rate, out_rate, quality="VHQ")
-        result = resampled_audio.astype(np.int16).tobytes()
-        return result
+        # soxr keeps the input dtype, so the output is already int16.
+        resampled_audio = soxr.resample(audio_data, in_rate, out_rate, quality=self._quality)
+        return resampled_audio.tobytes()
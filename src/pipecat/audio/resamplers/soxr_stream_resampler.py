@@ -31,8 +31,9 @@ class SOXRStreamAudioResampler(BaseAudioResampler):
     """Audio resampler implementation using the SoX ResampleStream library.
 
     This resampler uses the SoX ResampleStream library configured for very high
-    quality (VHQ) resampling, providing excellent audio quality at the cost
-    of additional computational overhead.
+    quality (VHQ) resampling by default, providing excellent audio quality at
+    the cost of additional computational overhead. Lower qualities can be
+    selected for CPU sensitive paths.
     It keeps an internal history which avoids clicks at chunk boundaries.
 
     Notes:
@@ -40,12 +41,15 @@ class SOXRStreamAudioResampler(BaseAudioResampler):
         - Input must be 16-bit signed PCM audio as raw bytes.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, quality: str = "VHQ", **kwargs):
         """Initialize the resampler.
 
         Args:
+            quality: SoX resampler quality ("QQ", "LQ", "MQ", "HQ" or "VHQ").
+                Defaults to "VHQ".
             **kwargs: Additional keyword arguments (currently unused).
         """
+        self._quality = quality
         self._in_rate: float | None = None
         self._out_rate: float | None = None
         self._last_resample_time: float = 0
@@ -56,7 +60,7 @@ class SOXRStreamAudioResampler(BaseAudioResampler):
         self._out_rate = out_rate
         self._last_resample_time = time.time()
         self._soxr_stream = soxr.ResampleStream(
-            in_rate=in_rate, out_rate=out_rate, num_channels=1, quality="VHQ", dtype="int16"
+            in_rate=in_rate, out_rate=out_rate, num_channels=1, quality=self._quality, dtype="int16"
         )
 
     def _maybe_clear_internal_state(self):
@@ -96,6 +100,6 @@ class SOXRStreamAudioResampler(BaseAudioResampler):
 
         self._maybe_initialize_sox_stream(in_rate, out_rate)
         audio_data = np.frombuffer(audio, dtype=np.int16)
+        # The stream is created with an int16 dtype, so the output is already int16.
         resampled_audio = self._soxr_stream.resample_chunk(audio_data)
-        result = resampled_audio.astype(np.int16).tobytes()
-        return result
+        return resampled_audio.tobytes()
@@ -11,10 +11,9 @@ output processing, including frame buffering, mixing, timing, and media streamin
 """
 
 import asyncio
-import itertools
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Type
 
 from loguru import logger
 from PIL import Image
@@ -306,15 +305,31 @@ class BaseOutputTransport(FrameProcessor):
         """
         await super().process_frame(frame, direction)
 
+        # System frames are checked as a group first, so the most common frames
+        # (e.g. audio) only need a couple of checks.
+        if isinstance(frame, SystemFrame):
+            await self._process_system_frame(frame, direction)
+        elif isinstance(frame, EndFrame):
+            await self.stop(frame)
+            # Keep pushing EndFrame down so all the pipeline stops nicely.
+            await self.push_frame(frame, direction)
+        elif direction == FrameDirection.UPSTREAM:
+            await self.push_frame(frame, direction)
+        else:
+            await self._handle_frame(frame)
+
+    async def _process_system_frame(self, frame: SystemFrame, direction: FrameDirection):
+        """Process system frames.
+
+        Args:
+            frame: The system frame to process.
+            direction: The direction of frame flow in the pipeline.
+        """
         if isinstance(frame, StartFrame):
             # Push StartFrame before start(), because we want StartFrame to be
             # processed by every processor before any other frame is processed.
             await self.push_frame(frame, direction)
             await self.start(frame)
-        elif isinstance(frame, EndFrame):
-            await self.stop(frame)
-            # Keep pushing EndFrame down so all the pipeline stops nicely.
-            await self.push_frame(frame, direction)
         elif isinstance(frame, CancelFrame):
             await self.cancel(frame)
             await self.push_frame(frame, direction)
@@ -325,12 +340,8 @@ class BaseOutputTransport(FrameProcessor):
             await self.send_message(frame)
         elif isinstance(frame, OutputDTMFUrgentFrame):
             await self.write_dtmf(frame)
-        elif isinstance(frame, SystemFrame):
-            await self.push_frame(frame, direction)
-        elif direction == FrameDirection.UPSTREAM:
-            await self.push_frame(frame, direction)
         else:
-            await self._handle_frame(frame)
+            await self.push_frame(frame, direction)
 
     async def _handle_frame(self, frame: Frame):
         """Handle frames by routing them to appropriate media senders."""
@@ -394,12 +405,19 @@ class BaseOutputTransport(FrameProcessor):
             self._audio_chunk_size = audio_chunk_size
             self._params = params
 
-            # This is to resize images. We only need to resize one image at a time.
-            self._executor = ThreadPoolExecutor(max_workers=1)
+            # This is to resize images. Live images are resized one at a time,
+            # but all the images of a sprite are resized in parallel (Pillow
+            # releases the GIL while resizing).
+            self._executor = ThreadPoolExecutor(max_workers=4)
 
             # Buffer to keep track of incoming audio.
             self._audio_buffer = bytearray()
 
+            # Silence mixed with the mixer audio when there's no audio to send.
+            # It never changes, so it's shared by all the mixer calls (and
+            # audio task restarts).
+            self._silence_chunk = bytes(self._audio_chunk_size)
+
             # This will be used to resample incoming audio to the output sample rate.
             self._resampler = create_stream_resampler()
 
@@ -407,8 +425,14 @@ class BaseOutputTransport(FrameProcessor):
             # destination, or a destination/mixer mapping.
             self._mixer: Optional[BaseAudioMixer] = None
 
-            # These are the images that we should send at our desired framerate.
-            self._video_images = None
+            # These are the images that we should send at our desired framerate,
+            # and the index of the next one to send.
+            self._video_images: List[OutputImageRawFrame] = []
+            self._video_image_index = 0
+            # Id of the (not resized) frame set with `_set_video_image()`, so we
+            # don't resize it again if it's set twice (assistant images are set
+            # when received and again when they reach the audio task).
+            self._video_image_id: Optional[int] = None
 
             # Indicates if the bot is currently speaking.
             self._bot_speaking = False
@@ -537,21 +561,40 @@ class BaseOutputTransport(FrameProcessor):
 
             # We might need to resample if incoming audio doesn't match the
             # transport sample rate.
-            resampled = await self._resampler.resample(
-                frame.audio, frame.sample_rate, self._sample_rate
-            )
+            if frame.sample_rate == self._sample_rate:
+                resampled = frame.audio
+            else:
+                resampled = await self._resampler.resample(
+                    frame.audio, frame.sample_rate, self._sample_rate
+                )
 
             cls = type(frame)
+            chunk_size = self._audio_chunk_size
             self._audio_buffer.extend(resampled)
-            while len(self._audio_buffer) >= self._audio_chunk_size:
-                chunk = cls(
-                    bytes(self._audio_buffer[: self._audio_chunk_size]),
-                    sample_rate=self._sample_rate,
-                    num_channels=frame.num_channels,
-                )
-                chunk.transport_destination = self._destination
+            num_chunks = len(self._audio_buffer) // chunk_size
+
+            # Copy all the complete chunks through a memoryview so each one is
+            # copied only once (slicing the bytearray would copy it first). The
+            # view needs to be released before the buffer is resized, so we
+            # don't hold it while queueing (the buffer might be cleared
+            # meanwhile).
+            with memoryview(self._audio_buffer) as audio_buffer:
+                chunks = [
+                    bytes(audio_buffer[i * chunk_size : (i + 1) * chunk_size])
+                    for i in range(num_chunks)
+                ]
+            # Drop the chunks in place, all at once.
+            del self._audio_buffer[: num_chunks * chunk_size]
+
+            # These are the same for all the chunks. Note that we don't keep a
+            # reference to the audio queue, it's recreated on interruptions.
+            sample_rate = self._sample_rate
+            num_channels = frame.num_channels
+            destination = self._destination
+            for audio in chunks:
+                chunk = cls(audio, sample_rate=sample_rate, num_channels=num_channels)
+                chunk.transport_destination = destination
                 await self._audio_queue.put(chunk)
-                self._audio_buffer = self._audio_buffer[self._audio_chunk_size :]
 
         async def handle_image_frame(self, frame: OutputImageRawFrame | SpriteFrame):
             """Handle incoming image frames for video output.
@@ -610,6 +653,24 @@ class BaseOutputTransport(FrameProcessor):
                 await self._transport.cancel_task(self._audio_task)
                 self._audio_task = None
 
+        async def _broadcast_frame(self, frame_cls: Type[Frame]):
+            """Push a new frame both downstream and upstream for this destination.
+
+            Args:
+                frame_cls: The class of the frame to broadcast.
+            """
+            downstream_frame = frame_cls()
+            downstream_frame.transport_destination = self._destination
+            upstream_frame = frame_cls()
+            upstream_frame.transport_destination = self._destination
+
+            # Setting the siblings id
+            upstream_frame.broadcast_sibling_id = downstream_frame.id
+            downstream_frame.broadcast_sibling_id = upstream_frame.id
+
+            await self._transport.push_frame(downstream_frame)
+            await self._transport.push_frame(upstream_frame, FrameDirection.UPSTREAM)
+
         async def _bot_started_speaking(self):
             """Handle bot started speaking event."""
             if self._bot_speaking:
@@ -621,17 +682,7 @@ class BaseOutputTransport(FrameProcessor):
                 f"Bot{f' [{self._destination}]' if self._destination else ''} started speaking"
             )
 
-            downstream_frame = BotStartedSpeakingFrame()
-            downstream_frame.transport_destination = self._destination
-            upstream_frame = BotStartedSpeakingFrame()
-            upstream_frame.transport_destination = self._destination
-
-            # Setting the siblings id
-            upstream_frame.broadcast_sibling_id = downstream_frame.id
-            downstream_frame.broadcast_sibling_id = upstream_frame.id
-
-            await self._transport.push_frame(downstream_frame)
-            await self._transport.push_frame(upstream_frame, FrameDirection.UPSTREAM)
+            await self._broadcast_frame(BotStartedSpeakingFrame)
 
         async def _bot_stopped_speaking(self):
             """Handle bot stopped speaking event."""
@@ -642,34 +693,24 @@ class BaseOutputTransport(FrameProcessor):
 
             # Clean audio buffer (there could be tiny left overs if not multiple
             # to our output chunk size).
-            self._audio_buffer = bytearray()
+            self._audio_buffer.clear()
 
             logger.debug(
                 f"Bot{f' [{self._destination}]' if self._destination else ''} stopped speaking"
             )
 
-            downstream_frame = BotStoppedSpeakingFrame()
-            downstream_frame.transport_destination = self._destination
-            upstream_frame = BotStoppedSpeakingFrame()
-            upstream_frame.transport_destination = self._destination
-
-            # Setting the siblings id
-            upstream_frame.broadcast_sibling_id = downstream_frame.id
-            downstream_frame.broadcast_sibling_id = upstream_frame.id
-
-            await self._transport.push_frame(downstream_frame)
-            await self._transport.push_frame(upstream_frame, FrameDirection.UPSTREAM)
+            await self._broadcast_frame(BotStoppedSpeakingFrame)
 
         async def _bot_currently_speaking(self):
             """Handle bot speaking event."""
             await self._bot_started_speaking()
 
-            diff_time = time.time() - self._bot_speaking_frame_time
-            if diff_time >= self._bot_speaking_frame_period:
-                await self._transport.broadcast_frame(BotSpeakingFrame)
-                self._bot_speaking_frame_time = time.time()
+            now = time.time()
+            if now - self._bot_speaking_frame_time >= self._bot_speaking_frame_period:
+                await self._broadcast_frame(BotSpeakingFrame)
+                self._bot_speaking_frame_time = now
 
-            self._bot_speech_last_time = time.time()
+            self._bot_speech_last_time = now
 
         async def _maybe_bot_currently_speaking(self, frame: SpeechOutputAudioRawFrame):
             if not is_silence(frame.audio):
@@ -715,19 +756,25 @@ class BaseOutputTransport(FrameProcessor):
 
             async def without_mixer(vad_stop_secs: float) -> AsyncGenerator[Frame, None]:
                 while True:
+                    # Frames usually arrive in bursts (e.g. a long TTS frame
+                    # split in chunks), so only pay for `wait_for()` when
+                    # there's nothing queued.
                     try:
-                        frame = await asyncio.wait_for(
-                            self._audio_queue.get(), timeout=vad_stop_secs
-                        )
-                        yield frame
-                        self._audio_queue.task_done()
-                    except asyncio.TimeoutError:
-                        # Notify the bot stopped speaking upstream if necessary.
-                        await self._bot_stopped_speaking()
+                        frame = self._audio_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        try:
+                            frame = await asyncio.wait_for(
+                                self._audio_queue.get(), timeout=vad_stop_secs
+                            )
+                        except asyncio.TimeoutError:
+                            # Notify the bot stopped speaking upstream if necessary.
+                            await self._bot_stopped_speaking()
+                            continue
+                    yield frame
+                    self._audio_queue.task_done()
 
             async def with_mixer(vad_stop_secs: float) -> AsyncGenerator[Frame, None]:
                 last_frame_time = 0
-                silence = b"\x00" * self._audio_chunk_size
                 while True:
                     try:
                         frame = self._audio_queue.get_nowait()
@@ -743,7 +790,7 @@ class BaseOutputTransport(FrameProcessor):
                             await self._bot_stopped_speaking()
                         # Generate an audio frame with only the mixer's part.
                         frame = OutputAudioRawFrame(
-                            audio=await self._mixer.mix(silence),
+                            audio=await self._mixer.mix(self._silence_chunk),
                             sample_rate=self._sample_rate,
                             num_channels=self._params.audio_out_channels,
                         )
@@ -787,12 +834,15 @@ class BaseOutputTransport(FrameProcessor):
                 push_downstream = True
 
                 # Try to send audio to the transport.
-                try:
-                    if isinstance(frame, OutputAudioRawFrame):
+                if isinstance(frame, OutputAudioRawFrame):
+                    try:
                         push_downstream = await self._transport.write_audio_frame(frame)
-                except Exception as e:
-                    logger.error(f"{self} Error writing {frame} to transport: {e}")
-                    push_downstream = False
+                    except Exception as e:
+                        logger.error(f"{self} Error writing {frame} to transport: {e}")
+                        push_downstream = False
+
+                    # Audio frames are only pushed if someone after us needs them.
+                    push_downstream = push_downstream and self._params.audio_out_passthrough
 
                 # If we were able to send to the transport, push the frame
                 # downstream in case anyone else needs it.
@@ -819,18 +869,38 @@ class BaseOutputTransport(FrameProcessor):
         async def _set_video_image(self, image: OutputImageRawFrame):
             """Set a single video image for cycling output.
 
+            The image is resized once here so the video task doesn't need to
+            resize it every time it's drawn.
+
             Args:
                 image: The image frame to cycle for video output.
             """
-            self._video_images = itertools.cycle([image])
+            if not self._params.video_out_enabled or self._params.video_out_is_live:
+                return
+
+            if image.id == self._video_image_id:
+                return
+
+            self._video_images = [await self._resize_image(image)]
+            self._video_image_index = 0
+            self._video_image_id = image.id
 
         async def _set_video_images(self, images: List[OutputImageRawFrame]):
             """Set multiple video images for cycling output.
 
+            The images are resized once here, in parallel, so the video task
+            doesn't need to resize them every time they are drawn.
+
             Args:
                 images: The list of image frames to cycle for video output.
             """
-            self._video_images = itertools.cycle(images)
+            if not self._params.video_out_enabled or self._params.video_out_is_live:
+                return
+
+            images = await asyncio.gather(*[self._resize_image(image) for image in images])
+            self._video_images = images
+            self._video_image_index = 0
+            self._video_image_id = None
 
         async def _video_task_handler(self):
             """Main video processing task handler."""
@@ -838,32 +908,55 @@ class BaseOutputTransport(FrameProcessor):
             self._video_frame_index = 0
             self._video_frame_duration = 1 / self._params.video_out_framerate
             self._video_frame_reset = self._video_frame_duration * 5
-            while True:
-                if self._params.video_out_is_live:
+
+            if self._params.video_out_is_live:
+                while True:
                     await self._video_is_live_handler()
-                elif self._video_images:
-                    image = next(self._video_images)
+
+            # Frames are scheduled at absolute (monotonic) times, so the time
+            # spent drawing doesn't accumulate as drift.
+            loop = self._transport.get_event_loop()
+            next_frame_time = loop.time()
+            while True:
+                images = self._video_images
+                if images:
+                    image = images[self._video_image_index % len(images)]
+                    self._video_image_index += 1
                     await self._draw_image(image)
-                    await asyncio.sleep(self._video_frame_duration)
-                else:
-                    await asyncio.sleep(self._video_frame_duration)
+
+                next_frame_time += self._video_frame_duration
+                now = loop.time()
+                # If we are too late (e.g. the transport was slow), don't try
+                # to catch up, just start over from now.
+                if now - next_frame_time > self._video_frame_reset:
+                    next_frame_time = now
+                await asyncio.sleep(max(0, next_frame_time - now))
 
         async def _video_is_live_handler(self):
             """Handle live video streaming with frame timing."""
             image = await self._video_queue.get()
 
+            # Live images are all different, so we need to resize each of
+            # them. Do it before waiting for the image render time, so resizing
+            # doesn't delay rendering.
+            image = await self._resize_image(image)
+
+            # Use the event loop monotonic clock, wall-clock adjustments
+            # shouldn't affect frame timing.
+            now = self._transport.get_event_loop().time()
+
             # We get the start time as soon as we get the first image.
-            if not self._video_start_time:
-                self._video_start_time = time.time()
+            if self._video_start_time is None:
+                self._video_start_time = now
                 self._video_frame_index = 0
 
             # Calculate how much time we need to wait before rendering next image.
-            real_elapsed_time = time.time() - self._video_start_time
+            real_elapsed_time = now - self._video_start_time
             real_render_time = self._video_frame_index * self._video_frame_duration
             delay_time = self._video_frame_duration + real_render_time - real_elapsed_time
 
             if abs(delay_time) > self._video_frame_reset:
-                self._video_start_time = time.time()
+                self._video_start_time = now
                 self._video_frame_index = 0
             elif delay_time > 0:
                 await asyncio.sleep(delay_time)
@@ -874,32 +967,58 @@ class BaseOutputTransport(FrameProcessor):
 
             self._video_queue.task_done()
 
-        async def _draw_image(self, frame: OutputImageRawFrame):
-            """Draw/render an image frame with resizing if needed.
+        def _resize_frame(self, frame: OutputImageRawFrame) -> OutputImageRawFrame:
+            """Resize an image frame to the output video size if needed.
 
             Args:
-                frame: The image frame to draw.
+                frame: The image frame to resize.
+
+            Returns:
+                The original frame if it already has the output size, otherwise
+                a new resized frame.
             """
+            desired_size = (self._params.video_out_width, self._params.video_out_height)
 
-            def resize_frame(frame: OutputImageRawFrame) -> OutputImageRawFrame:
-                desired_size = (self._params.video_out_width, self._params.video_out_height)
+            # TODO: we should refactor in the future to support dynamic resolutions
+            # which is kind of what happens in P2P connections.
+            # We need to add support for that inside the DailyTransport
+            if frame.size == desired_size:
+                return frame
 
-                # TODO: we should refactor in the future to support dynamic resolutions
-                # which is kind of what happens in P2P connections.
-                # We need to add support for that inside the DailyTransport
-                if frame.size != desired_size:
-                    image = Image.frombytes(frame.format, frame.size, frame.image)
-                    resized_image = image.resize(desired_size)
-                    # logger.warning(f"{frame} does not have the expected size {desired_size}, resizing")
-                    frame = OutputImageRawFrame(
-                        resized_image.tobytes(), resized_image.size, resized_image.format
-                    )
+            image = Image.frombytes(frame.format, frame.size, frame.image)
+            resized_image = image.resize(desired_size)
+            resized_frame = OutputImageRawFrame(
+                resized_image.tobytes(), resized_image.size, resized_image.format
+            )
+            resized_frame.transport_destination = frame.transport_destination
+            return resized_frame
 
+        async def _resize_image(self, frame: OutputImageRawFrame) -> OutputImageRawFrame:
+            """Resize an image frame in the image executor so we don't block the event loop.
+
+            Args:
+                frame: The image frame to resize.
+
+            Returns:
+                The image frame with the output video size.
+            """
+            desired_size = (self._params.video_out_width, self._params.video_out_height)
+            if frame.size == desired_size:
                 return frame
 
-            frame = await self._transport.get_event_loop().run_in_executor(
-                self._executor, resize_frame, frame
+            return await self._transport.get_event_loop().run_in_executor(
+                self._executor, self._resize_frame, frame
             )
+
+        async def _draw_image(self, frame: OutputImageRawFrame):
+            """Draw/render an image frame.
+
+            Images are expected to be already resized to the output video size
+            (see `_resize_image()`).
+
+            Args:
+                frame: The image frame to draw.
+            """
             await self._transport.write_video_frame(frame)
 
         #
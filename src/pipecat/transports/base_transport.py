@@ -84,6 +84,9 @@ class TransportParams(BaseModel):
         audio_out_mixer: Audio mixer instance or destination mapping.
         audio_out_destinations: List of audio output destination identifiers.
         audio_out_end_silence_secs: How much silence to send after an EndFrame (0 for no silence).
+        audio_out_passthrough: Push output audio frames downstream after they are
+            written to the transport. Disable it if there's nothing after the
+            output transport that needs them.
         audio_in_enabled: Enable audio input streaming.
         audio_in_sample_rate: Input audio sample rate in Hz.
         audio_in_channels: Number of input audio channels.
@@ -143,6 +146,7 @@ class TransportParams(BaseModel):
     audio_out_mixer: Optional[BaseAudioMixer | Mapping[Optional[str], BaseAudioMixer]] = None
     audio_out_destinations: List[str] = Field(default_factory=list)
     audio_out_end_silence_secs: int = 2
+    audio_out_passthrough: bool = True
     audio_in_enabled: bool = False
     audio_in_sample_rate: Optional[int] = None
     audio_in_channels: int = 1
@@ -0,0 +1,376 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from pipecat.audio.mixers.base_audio_mixer import BaseAudioMixer
+from pipecat.frames.frames import (
+    AssistantImageRawFrame,
+    BotSpeakingFrame,
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    EndFrame,
+    MixerControlFrame,
+    OutputAudioRawFrame,
+    OutputImageRawFrame,
+    OutputTransportReadyFrame,
+    SpriteFrame,
+    StartFrame,
+    TTSAudioRawFrame,
+)
+from pipecat.tests.utils import SleepFrame, run_test
+from pipecat.transports.base_output import BaseOutputTransport
+from pipecat.transports.base_transport import TransportParams
+
+
+class RecordingOutputTransport(BaseOutputTransport):
+    """Output transport that records everything written to it.
+
+    If `min_video_frames` is given, stopping waits (up to a generous timeout)
+    until that many video frames have been written, so tests don't depend on
+    how many frames fit in a fixed time window.
+    """
+
+    def __init__(self, params: TransportParams, min_video_frames: int = 0, **kwargs):
+        super().__init__(params, **kwargs)
+        self.audio_frames: List[OutputAudioRawFrame] = []
+        self.video_frames: List[OutputImageRawFrame] = []
+        self._min_video_frames = min_video_frames
+        self._video_frames_event = asyncio.Event()
+        if min_video_frames == 0:
+            self._video_frames_event.set()
+
+    async def start(self, frame: StartFrame):
+        await super().start(frame)
+        await self.set_transport_ready(frame)
+
+    async def stop(self, frame: EndFrame):
+        try:
+            await asyncio.wait_for(self._video_frames_event.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            pass
+        await super().stop(frame)
+
+    async def write_audio_frame(self, frame: OutputAudioRawFrame) -> bool:
+        self.audio_frames.append(frame)
+        return True
+
+    async def write_video_frame(self, frame: OutputImageRawFrame) -> bool:
+        self.video_frames.append(frame)
+        if len(self.video_frames) >= self._min_video_frames:
+            self._video_frames_event.set()
+        return True
+
+
+class RecordingMixer(BaseAudioMixer):
+    """Mixer that records the audio it's asked to mix and returns it as is."""
+
+    def __init__(self):
+        self.mixed: List[bytes] = []
+
+    async def start(self, sample_rate: int):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def process_frame(self, frame: MixerControlFrame):
+        pass
+
+    async def mix(self, audio: bytes) -> bytes:
+        self.mixed.append(audio)
+        return audio
+
+
+class TestBaseOutputTransportAudio(unittest.IsolatedAsyncioTestCase):
+    async def test_audio_is_chunked(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True, audio_out_sample_rate=16000, audio_out_10ms_chunks=1
+            )
+        )
+
+        # 10ms at 16kHz mono is 320 bytes, send 3.5 chunks worth of audio.
+        audio = bytes(range(256)) * 5
+        audio = audio[: 320 * 3 + 160]
+
+        await run_test(
+            transport,
+            frames_to_send=[TTSAudioRawFrame(audio=audio, sample_rate=16000, num_channels=1)],
+        )
+
+        chunks = [frame for frame in transport.audio_frames if isinstance(frame, TTSAudioRawFrame)]
+        self.assertEqual(len(chunks), 3)
+        for chunk in chunks:
+            self.assertEqual(len(chunk.audio), 320)
+            self.assertEqual(chunk.sample_rate, 16000)
+            self.assertEqual(chunk.num_channels, 1)
+        self.assertEqual(b"".join(chunk.audio for chunk in chunks), audio[: 320 * 3])
+
+    async def test_audio_leftovers_are_kept(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True, audio_out_sample_rate=16000, audio_out_10ms_chunks=1
+            )
+        )
+
+        # Two frames of 1.5 chunks each, leftovers should be joined.
+        audio = bytes(range(256)) * 4
+        audio = audio[: 320 * 3]
+        frames = [
+            TTSAudioRawFrame(audio=audio[:480], sample_rate=16000, num_channels=1),
+            TTSAudioRawFrame(audio=audio[480:], sample_rate=16000, num_channels=1),
+        ]
+
+        await run_test(transport, frames_to_send=frames)
+
+        chunks = [frame for frame in transport.audio_frames if isinstance(frame, TTSAudioRawFrame)]
+        self.assertEqual([len(chunk.audio) for chunk in chunks], [320] * 3)
+        self.assertEqual(b"".join(chunk.audio for chunk in chunks), audio)
+
+    async def test_audio_is_resampled(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True, audio_out_sample_rate=16000, audio_out_10ms_chunks=1
+            )
+        )
+
+        # 400ms of 8kHz audio. The stream resampler keeps some audio internally,
+        # so we don't get all of it back.
+        frames = [
+            TTSAudioRawFrame(audio=b"\x00\x10" * 800, sample_rate=8000, num_channels=1)
+            for _ in range(4)
+        ]
+
+        await run_test(transport, frames_to_send=frames)
+
+        chunks = [frame for frame in transport.audio_frames if isinstance(frame, TTSAudioRawFrame)]
+        self.assertGreaterEqual(len(chunks), 20)
+        for chunk in chunks:
+            self.assertEqual(len(chunk.audio), 320)
+            self.assertEqual(chunk.sample_rate, 16000)
+
+    async def test_bot_speaking_frames_are_broadcasted(self):
+        transport = RecordingOutputTransport(
+            TransportParams(audio_out_enabled=True, audio_out_sample_rate=16000)
+        )
+
+        # 80ms of audio (two 40ms chunks).
+        frames_to_send = [
+            TTSAudioRawFrame(audio=b"\x10\x10" * 1280, sample_rate=16000, num_channels=1),
+            SleepFrame(sleep=0.5),
+        ]
+        expected_frames = [BotStartedSpeakingFrame, BotSpeakingFrame, BotStoppedSpeakingFrame]
+
+        down_frames, up_frames = await run_test(
+            transport,
+            frames_to_send=frames_to_send,
+            expected_down_frames=[
+                BotStartedSpeakingFrame,
+                BotSpeakingFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                BotStoppedSpeakingFrame,
+            ],
+            expected_up_frames=[OutputTransportReadyFrame, *expected_frames],
+        )
+
+        down_frames = [f for f in down_frames if not isinstance(f, TTSAudioRawFrame)]
+        for down, up in zip(down_frames, up_frames[1:]):
+            self.assertIs(type(down), type(up))
+            self.assertEqual(down.broadcast_sibling_id, up.id)
+            self.assertEqual(up.broadcast_sibling_id, down.id)
+            self.assertIsNone(down.transport_destination)
+            self.assertIsNone(up.transport_destination)
+
+    async def test_bot_speaking_frames_destination(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True,
+                audio_out_sample_rate=16000,
+                audio_out_destinations=["dest"],
+            )
+        )
+
+        audio_frame = TTSAudioRawFrame(audio=b"\x10\x10" * 1280, sample_rate=16000, num_channels=1)
+        audio_frame.transport_destination = "dest"
+
+        expected_frames = [BotStartedSpeakingFrame, BotSpeakingFrame, BotStoppedSpeakingFrame]
+
+        down_frames, up_frames = await run_test(
+            transport,
+            frames_to_send=[audio_frame, SleepFrame(sleep=0.5)],
+            expected_down_frames=[
+                BotStartedSpeakingFrame,
+                BotSpeakingFrame,
+                TTSAudioRawFrame,
+                TTSAudioRawFrame,
+                BotStoppedSpeakingFrame,
+            ],
+            expected_up_frames=[OutputTransportReadyFrame, *expected_frames],
+        )
+
+        # Bot speaking frames (in both directions) belong to the destination
+        # that played the audio.
+        speaking_frames = [f for f in down_frames if not isinstance(f, TTSAudioRawFrame)]
+        speaking_frames += up_frames[1:]
+        for frame in speaking_frames:
+            self.assertEqual(frame.transport_destination, "dest")
+
+    async def test_audio_passthrough_disabled(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True, audio_out_sample_rate=16000, audio_out_passthrough=False
+            )
+        )
+
+        await run_test(
+            transport,
+            frames_to_send=[
+                TTSAudioRawFrame(audio=b"\x10\x10" * 1280, sample_rate=16000, num_channels=1),
+                SleepFrame(sleep=0.5),
+            ],
+            expected_down_frames=[
+                BotStartedSpeakingFrame,
+                BotSpeakingFrame,
+                BotStoppedSpeakingFrame,
+            ],
+        )
+
+        # Audio is still written to the transport.
+        chunks = [frame for frame in transport.audio_frames if isinstance(frame, TTSAudioRawFrame)]
+        self.assertEqual(len(chunks), 2)
+
+    async def test_mixer_mixes_silence_when_idle(self):
+        mixer = RecordingMixer()
+        transport = RecordingOutputTransport(
+            TransportParams(
+                audio_out_enabled=True,
+                audio_out_sample_rate=16000,
+                audio_out_10ms_chunks=1,
+                audio_out_mixer=mixer,
+            )
+        )
+
+        await run_test(transport, frames_to_send=[SleepFrame(sleep=0.1)])
+
+        self.assertGreater(len(mixer.mixed), 0)
+        self.assertTrue(all(audio == bytes(320) for audio in mixer.mixed))
+        self.assertGreater(len(transport.audio_frames), 0)
+
+
+class TestBaseOutputTransportVideo(unittest.IsolatedAsyncioTestCase):
+    async def test_sprite_images_are_resized(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                video_out_enabled=True,
+                video_out_width=2,
+                video_out_height=2,
+                video_out_framerate=100,
+            ),
+            min_video_frames=4,
+        )
+
+        images = [
+            OutputImageRawFrame(image=bytes([i]) * 4 * 4 * 3, size=(4, 4), format="RGB")
+            for i in range(3)
+        ]
+
+        await run_test(transport, frames_to_send=[SpriteFrame(images=images)])
+
+        self.assertGreater(len(transport.video_frames), len(images))
+        for frame in transport.video_frames:
+            self.assertEqual(frame.size, (2, 2))
+            self.assertEqual(len(frame.image), 2 * 2 * 3)
+        # Images are cycled in order and wrap around.
+        self.assertEqual(
+            [frame.image[0] for frame in transport.video_frames[:4]],
+            [0, 1, 2, 0],
+        )
+
+    async def test_live_images_are_resized(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                video_out_enabled=True,
+                video_out_is_live=True,
+                video_out_width=2,
+                video_out_height=2,
+                video_out_framerate=100,
+            ),
+            min_video_frames=3,
+        )
+
+        images = [
+            OutputImageRawFrame(image=bytes([i]) * 4 * 4 * 3, size=(4, 4), format="RGB")
+            for i in range(3)
+        ]
+
+        await run_test(transport, frames_to_send=images)
+
+        self.assertEqual([frame.size for frame in transport.video_frames], [(2, 2)] * 3)
+        self.assertEqual([frame.image[0] for frame in transport.video_frames], [0, 1, 2])
+
+    async def test_assistant_image_audio_only(self):
+        transport = RecordingOutputTransport(
+            TransportParams(audio_out_enabled=True, audio_out_sample_rate=16000)
+        )
+
+        image = AssistantImageRawFrame(image=bytes(4 * 4 * 3), size=(4, 4), format="RGB")
+
+        resize_frame = BaseOutputTransport.MediaSender._resize_frame
+        with patch.object(
+            BaseOutputTransport.MediaSender,
+            "_resize_frame",
+            autospec=True,
+            side_effect=resize_frame,
+        ) as mock_resize_frame:
+            await run_test(
+                transport,
+                frames_to_send=[image],
+                expected_down_frames=[AssistantImageRawFrame],
+            )
+
+        mock_resize_frame.assert_not_called()
+        self.assertEqual(transport.video_frames, [])
+
+    async def test_assistant_image_is_resized_once(self):
+        transport = RecordingOutputTransport(
+            TransportParams(
+                video_out_enabled=True,
+                video_out_width=2,
+                video_out_height=2,
+                video_out_framerate=100,
+            ),
+            min_video_frames=2,
+        )
+
+        image = AssistantImageRawFrame(image=bytes(4 * 4 * 3), size=(4, 4), format="RGB")
+
+        resize_frame = BaseOutputTransport.MediaSender._resize_frame
+        with patch.object(
+            BaseOutputTransport.MediaSender,
+            "_resize_frame",
+            autospec=True,
+            side_effect=resize_frame,
+        ) as mock_resize_frame:
+            await run_test(
+                transport,
+                frames_to_send=[image],
+                expected_down_frames=[AssistantImageRawFrame],
+            )
+
+        mock_resize_frame.assert_called_once()
+        # The same resized image is drawn on every tick.
+        self.assertGreaterEqual(len(transport.video_frames), 2)
+        for frame in transport.video_frames:
+            self.assertEqual(frame.size, (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import soxr
+
+from pipecat.audio.resamplers.soxr_resampler import SOXRAudioResampler
+from pipecat.audio.resamplers.soxr_stream_resampler import SOXRStreamAudioResampler
+
+AUDIO = np.zeros(160, dtype=np.int16).tobytes()
+
+
+class TestSOXRResamplerQuality(unittest.IsolatedAsyncioTestCase):
+    async def test_resampler_default_quality(self):
+        with patch("soxr.resample", wraps=soxr.resample) as mock_resample:
+            await SOXRAudioResampler().resample(AUDIO, 16000, 48000)
+        self.assertEqual(mock_resample.call_args.kwargs["quality"], "VHQ")
+
+    async def test_resampler_custom_quality(self):
+        with patch("soxr.resample", wraps=soxr.resample) as mock_resample:
+            await SOXRAudioResampler(quality="QQ").resample(AUDIO, 16000, 48000)
+        self.assertEqual(mock_resample.call_args.kwargs["quality"], "QQ")
+
+    async def test_stream_resampler_default_quality(self):
+        with patch("soxr.ResampleStream", wraps=soxr.ResampleStream) as mock_stream:
+            await SOXRStreamAudioResampler().resample(AUDIO, 16000, 48000)
+        self.assertEqual(mock_stream.call_args.kwargs["quality"], "VHQ")
+
+    async def test_stream_resampler_custom_quality(self):
+        with patch("soxr.ResampleStream", wraps=soxr.ResampleStream) as mock_stream:
+            await SOXRStreamAudioResampler(quality="QQ").resample(AUDIO, 16000, 48000)
+        self.assertEqual(mock_stream.call_args.kwargs["quality"], "QQ")
+
+
+if __name__ == "__main__":
+    unittest.main()